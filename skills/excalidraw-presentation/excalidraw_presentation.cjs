@@ -74,6 +74,12 @@ const COLORS = {
   },
 };
 
+// Drop-shadow styling shared by every shadow rect — one set of
+// references instead of per-call literals.
+const SHADOW_OFFSET = 6;
+const SHADOW_FILL = "#adb5bd";
+const SHADOW_OPACITY = 40;
+
 // Measured digit widths for Nunito (fontFamily 6) as fraction of fontSize
 // via canvas.measureText — digits are narrower than avg Latin char (0.62)
 const DIGIT_WIDTHS_NUNITO = {
@@ -81,8 +87,183 @@ const DIGIT_WIDTHS_NUNITO = {
   '5': 0.57, '6': 0.57, '7': 0.55, '8': 0.57, '9': 0.57,
 };
 
+// Font width multipliers (measured from browser canvas.measureText):
+// fontFamily 5 (Excalifont): hand-drawn, widest -> 0.85
+// fontFamily 6 (Nunito): normal sans-serif -> 0.62 (latin), 0.72 (cyrillic)
+// fontFamily 7 (Lilita One): bold display -> 0.65 (latin), 0.75 (cyrillic)
+// fontFamily 8 (Comic Shanns): code/mono -> 0.68
+// Emoji: exactly 1.0x fontSize (confirmed via browser measurement)
+// Cyrillic letters are ~15-18% wider on average (fewer narrow chars like i/l/t)
+const FAMILY_MULT = { 5: 0.85, 6: 0.62, 7: 0.65, 8: 0.68 };
+const FAMILY_CYR_MULT = { 6: 0.72, 7: 0.75 };
+
+// Excalidraw applies lineHeight 1.25 uniformly to every text element.
+const LINE_HEIGHT = 1.25;
+
+// ─── Text measurement (module-level, memoized) ──────────────────
+// Deck labels repeat heavily ("ДЕМО", "5 мин", card titles, bullet
+// prefixes), and every text()/center* call re-measures them char by
+// char. Cache results per (text, fontSize, fontFamily) with a small
+// LRU so repeated labels become O(1) map hits.
+const MEASURE_CACHE_MAX = 4096;
+const _metricsCache = new Map();
+
+function _cacheGet(cache, key) {
+  const hit = cache.get(key);
+  if (hit !== undefined) {
+    // Map preserves insertion order — delete + re-set refreshes recency.
+    cache.delete(key);
+    cache.set(key, hit);
+  }
+  return hit;
+}
+
+function _cacheSet(cache, key, value) {
+  if (cache.size >= MEASURE_CACHE_MAX) {
+    cache.delete(cache.keys().next().value);
+  }
+  cache.set(key, value);
+}
+
+function _isEmojiChar(char) {
+  const cp = char.codePointAt(0);
+  // Common emoji ranges: Misc Symbols, Dingbats, Emoticons, Transport, Supplemental, etc.
+  return (
+    (cp >= 0x1f300 && cp <= 0x1faff) ||
+    (cp >= 0x2600 && cp <= 0x27bf) ||
+    (cp >= 0xfe00 && cp <= 0xfe0f) ||
+    (cp >= 0x2300 && cp <= 0x23ff)
+  );
+}
+
+function _isCyrillicChar(char) {
+  const cp = char.codePointAt(0);
+  return (cp >= 0x0400 && cp <= 0x04FF);
+}
+
+function _lineWidth(line, fontSize, fontFamily, mult, cyrMult) {
+  let w = 0;
+  for (const ch of line) {
+    // DO NOT add emoji width here — Excalidraw measures emojis separately
+    // and adds their width on top. Adding it here would double-count.
+    if (_isEmojiChar(ch)) continue;
+    if (fontFamily === 6 && DIGIT_WIDTHS_NUNITO[ch] !== undefined) {
+      w += fontSize * DIGIT_WIDTHS_NUNITO[ch];
+    } else {
+      w += fontSize * (_isCyrillicChar(ch) ? cyrMult : mult);
+    }
+  }
+  return w;
+}
+
+// Returns [width, height]; height is lines * fontSize * LINE_HEIGHT.
+function _textMetricsCached(text, fontSize, fontFamily) {
+  // Placeholder/empty strings (nCards defaults missing titles/bodies to
+  // "") don't need a cache slot: zero width, one line tall.
+  if (text === "") return [0, fontSize * LINE_HEIGHT];
+
+  const key = `${fontFamily}|${fontSize}|${text}`;
+  const hit = _cacheGet(_metricsCache, key);
+  if (hit !== undefined) return hit;
+
+  const mult = FAMILY_MULT[fontFamily] ?? 0.62;
+  const cyrMult = FAMILY_CYR_MULT[fontFamily] ?? mult;
+
+  let metrics;
+  if (!text.includes("\n")) {
+    // Fast path: most labels are single-line — skip the split allocation.
+    metrics = [
+      _lineWidth(text, fontSize, fontFamily, mult, cyrMult),
+      fontSize * LINE_HEIGHT,
+    ];
+  } else {
+    const lines = text.split("\n");
+    // Track the max inline — no lineWidths array, no Math.max(...spread).
+    let width = 0;
+    for (const l of lines) {
+      const w = _lineWidth(l, fontSize, fontFamily, mult, cyrMult);
+      if (w > width) width = w;
+    }
+    metrics = [width, lines.length * fontSize * LINE_HEIGHT];
+  }
+  _cacheSet(_metricsCache, key, metrics);
+  return metrics;
+}
+
+// Emoji count per string, memoized — centerTextInCircle adds fontSize
+// per emoji on top of the cached width, so cache the count instead of
+// rescanning the string on every centering call.
+const _emojiCountCache = new Map();
+
+function _emojiCount(text) {
+  const hit = _cacheGet(_emojiCountCache, text);
+  if (hit !== undefined) return hit;
+  let n = 0;
+  for (const ch of text) {
+    if (_isEmojiChar(ch)) n += 1;
+  }
+  _cacheSet(_emojiCountCache, text, n);
+  return n;
+}
+
+// Fields shared by every element regardless of shape. Shape templates
+// below spread this and add their own invariants; factories then spread
+// the template and override only the per-call fields, so building an
+// element is one shape-stable copy instead of a 20-key literal.
+const COMMON_ELEMENT_FIELDS = {
+  angle: 0,
+  fillStyle: "solid",
+  strokeStyle: "solid",
+  roughness: 1,
+  opacity: 100,
+  isDeleted: false,
+  locked: false,
+  version: 1,
+  versionNonce: 1,
+};
+
 // ─── Base element factory ───────────────────────────────────────
 class ExcalidrawPresentation {
+  // groupIds/boundElements are minted fresh per element (the Excalidraw
+  // runtime rewrites them in place), so they are NOT part of the templates.
+  // Always-null fields (frameId, containerId, roundness, line bindings)
+  // are omitted outright — Excalidraw's restore fills them in, and the
+  // server types mark them optional — which shrinks every serialized
+  // element.
+  // Templates are frozen: spreading a frozen template with a fixed set of
+  // overrides gives every element of a shape the same V8 hidden class, so
+  // property access stays monomorphic and per-element memory is minimal —
+  // no separate element classes needed.
+  static _RECT_TEMPLATE = Object.freeze({
+    ...COMMON_ELEMENT_FIELDS,
+    type: "rectangle",
+  });
+  static _TEXT_TEMPLATE = Object.freeze({
+    ...COMMON_ELEMENT_FIELDS,
+    type: "text",
+    backgroundColor: "transparent",
+    strokeWidth: 2,
+    verticalAlign: "top",
+    autoResize: true,
+    lineHeight: LINE_HEIGHT,
+  });
+  static _CIRCLE_TEMPLATE = Object.freeze({
+    ...COMMON_ELEMENT_FIELDS,
+    type: "ellipse",
+    strokeWidth: 2,
+  });
+  static _LINE_TEMPLATE = Object.freeze({
+    ...COMMON_ELEMENT_FIELDS,
+    type: "line",
+    height: 0,
+    backgroundColor: "transparent",
+  });
+  static _DIAMOND_TEMPLATE = Object.freeze({
+    ...COMMON_ELEMENT_FIELDS,
+    type: "diamond",
+    strokeWidth: 2,
+  });
+
   static SLIDE_WIDTH = 977;
   static SLIDE_X = 15;
   static CONTENT_X = 42;
@@ -122,80 +303,51 @@ class ExcalidrawPresentation {
     return ExcalidrawPresentation.GAP_BETWEEN_SLIDES;
   }
 
+  // Seeds only need to be distinct positive ints (they feed Excalidraw's
+  // roughness jitter), so a class-level counter replaces per-instance
+  // RNG: each instance claims a 1M block and _nextSeed walks within it.
+  static _seedBase = 100000;
+
   constructor() {
     this.elements = [];
-    this._seed = Math.floor(Math.random() * 900000) + 100000;
+    this._byId = new Map();
+    this._seed = ExcalidrawPresentation._seedBase;
+    ExcalidrawPresentation._seedBase += 1000000;
     this._currentY = 0;
     this.slides = [];
   }
 
+  // All factories funnel insertion through here so compound builders can
+  // look elements up by id in O(1) instead of scanning this.elements.
+  _push(el) {
+    this.elements.push(el);
+    this._byId.set(el.id, el);
+    return el;
+  }
+
   _nextSeed() {
-    this._seed += 1;
-    return this._seed;
+    return ++this._seed;
   }
 
   _isEmoji(char) {
-    const cp = char.codePointAt(0);
-    // Common emoji ranges: Misc Symbols, Dingbats, Emoticons, Transport, Supplemental, etc.
-    return (
-      (cp >= 0x1f300 && cp <= 0x1faff) ||
-      (cp >= 0x2600 && cp <= 0x27bf) ||
-      (cp >= 0xfe00 && cp <= 0xfe0f) ||
-      (cp >= 0x2300 && cp <= 0x23ff)
-    );
+    return _isEmojiChar(char);
   }
 
   _isCyrillic(char) {
-    const cp = char.codePointAt(0);
-    return (cp >= 0x0400 && cp <= 0x04FF);
+    return _isCyrillicChar(char);
   }
 
   _textWidth(text, fontSize, fontFamily = 6) {
-    const lines = text.split("\n");
-    // Font width multipliers (measured from browser canvas.measureText):
-    // fontFamily 5 (Excalifont): hand-drawn, widest -> 0.85
-    // fontFamily 6 (Nunito): normal sans-serif -> 0.62 (latin), 0.72 (cyrillic)
-    // fontFamily 7 (Lilita One): bold display -> 0.65 (latin), 0.75 (cyrillic)
-    // fontFamily 8 (Comic Shanns): code/mono -> 0.68
-    // Emoji: exactly 1.0x fontSize (confirmed via browser measurement)
-    // Cyrillic letters are ~15-18% wider on average (fewer narrow chars like i/l/t)
-    const mult =
-      fontFamily === 5
-        ? 0.85
-        : fontFamily === 8
-        ? 0.68
-        : fontFamily === 7
-        ? 0.65
-        : 0.62;
-    const cyrMult =
-      fontFamily === 6
-        ? 0.72
-        : fontFamily === 7
-        ? 0.75
-        : mult;
-
-    const lineWidths = lines.map((l) => {
-      let w = 0;
-      for (const ch of l) {
-        // DO NOT add emoji width here — Excalidraw measures emojis separately
-        // and adds their width on top. Adding it here would double-count.
-        if (this._isEmoji(ch)) continue;
-        if (fontFamily === 6 && DIGIT_WIDTHS_NUNITO[ch] !== undefined) {
-          w += fontSize * DIGIT_WIDTHS_NUNITO[ch];
-        } else {
-          w += fontSize * (this._isCyrillic(ch) ? cyrMult : mult);
-        }
-      }
-      return w;
-    });
-
-    return Math.max(...lineWidths);
+    return _textMetricsCached(text, fontSize, fontFamily)[0];
   }
 
   _textHeight(text, fontSize) {
-    const lines = text.split("\n");
-    // All lines use lineHeight 1.25 (Excalidraw applies lineHeight uniformly)
-    return lines.length * fontSize * 1.25;
+    return _textMetricsCached(text, fontSize, 6)[1];
+  }
+
+  // Combined [width, height] — one cache hit where callers need both.
+  _textMetrics(text, fontSize, fontFamily = 6) {
+    return _textMetricsCached(text, fontSize, fontFamily);
   }
 
   _wrapText(text, maxWidth, fontSize, fontFamily = 6) {
@@ -225,18 +377,14 @@ class ExcalidrawPresentation {
   // ── Centering helpers ───────────────────────────────────────
 
   centerTextInRect(text, fontSize, rectX, rectY, rectW, rectH, family = 6) {
-    const tw = this._textWidth(text, fontSize, family);
-    const th = this._textHeight(text, fontSize);
+    const [tw, th] = this._textMetrics(text, fontSize, family);
     return [rectX + (rectW - tw) / 2, rectY + (rectH - th) / 2];
   }
 
   centerTextInCircle(id, text, fontSize, circleX, circleY, diameter, family = 6, color = "#ffffff") {
     // Full visual width including emojis (_textWidth skips them)
-    let tw = this._textWidth(text, fontSize, family);
-    for (const ch of text) {
-      if (this._isEmoji(ch)) tw += fontSize * 1.0;
-    }
-    const th = this._textHeight(text, fontSize);
+    let [tw, th] = this._textMetrics(text, fontSize, family);
+    tw += fontSize * _emojiCount(text);
     const tx = circleX + (diameter - tw) / 2;
     const ty = circleY + (diameter - th) / 2;
     return this.text(id, tx, ty, text, fontSize, family, color);
@@ -257,32 +405,24 @@ class ExcalidrawPresentation {
     opacity = 100
   ) {
     const el = {
+      ...ExcalidrawPresentation._RECT_TEMPLATE,
       id,
-      type: "rectangle",
       x,
       y,
       width: w,
       height: h,
-      angle: 0,
       strokeColor: stroke,
       backgroundColor: fill,
-      fillStyle: "solid",
       strokeWidth,
-      strokeStyle: "solid",
-      roughness: 1,
       opacity,
+      // undefined (vs null) keeps the object shape stable while letting
+      // JSON.stringify drop the key for sharp-cornered rects.
+      roundness: roundness ? { type: roundness } : undefined,
       groupIds: [],
-      frameId: null,
-      roundness: roundness ? { type: roundness } : null,
-      isDeleted: false,
       boundElements: [],
-      locked: false,
       seed: this._nextSeed(),
-      version: 1,
-      versionNonce: 1,
     };
-    this.elements.push(el);
-    return el;
+    return this._push(el);
   }
 
   text(
@@ -295,11 +435,10 @@ class ExcalidrawPresentation {
     color = "#1e1e1e",
     align = "left"
   ) {
-    const w = this._textWidth(text, size, family);
-    const h = this._textHeight(text, size);
+    const [w, h] = this._textMetrics(text, size, family);
     const el = {
+      ...ExcalidrawPresentation._TEXT_TEMPLATE,
       id,
-      type: "text",
       x,
       y,
       width: w,
@@ -308,129 +447,68 @@ class ExcalidrawPresentation {
       fontSize: size,
       fontFamily: family,
       textAlign: align,
-      verticalAlign: "top",
       strokeColor: color,
-      backgroundColor: "transparent",
-      fillStyle: "solid",
-      roughness: 1,
-      isDeleted: false,
-      strokeWidth: 2,
-      strokeStyle: "solid",
-      opacity: 100,
-      angle: 0,
+      originalText: text,
       groupIds: [],
-      frameId: null,
-      roundness: null,
       boundElements: [],
-      locked: false,
-      containerId: null,
-      originalText: text,
-      autoResize: true,
-      lineHeight: 1.25,
       seed: this._nextSeed(),
-      version: 1,
-      versionNonce: 1,
     };
-    this.elements.push(el);
-    return el;
+    return this._push(el);
   }
 
   circle(id, x, y, size, fill, stroke) {
     const el = {
+      ...ExcalidrawPresentation._CIRCLE_TEMPLATE,
       id,
-      type: "ellipse",
       x,
       y,
       width: size,
       height: size,
       backgroundColor: fill,
       strokeColor: stroke,
-      strokeWidth: 2,
-      fillStyle: "solid",
-      roughness: 1,
-      isDeleted: false,
-      strokeStyle: "solid",
-      opacity: 100,
-      angle: 0,
       groupIds: [],
-      frameId: null,
-      roundness: null,
       boundElements: [],
-      locked: false,
       seed: this._nextSeed(),
-      version: 1,
-      versionNonce: 1,
     };
-    this.elements.push(el);
-    return el;
+    return this._push(el);
   }
 
   line(id, x, y, length, color = "#ced4da", width = 2) {
     const el = {
+      ...ExcalidrawPresentation._LINE_TEMPLATE,
       id,
-      type: "line",
       x,
       y,
       width: length,
-      height: 0,
       strokeColor: color,
       strokeWidth: width,
-      fillStyle: "solid",
-      roughness: 1,
-      isDeleted: false,
-      strokeStyle: "solid",
-      opacity: 100,
-      angle: 0,
-      groupIds: [],
-      frameId: null,
       roundness: { type: 2 },
-      boundElements: [],
-      locked: false,
       points: [
         [0, 0],
         [length, 0],
       ],
-      startBinding: null,
-      endBinding: null,
-      startArrowhead: null,
-      endArrowhead: null,
+      groupIds: [],
+      boundElements: [],
       seed: this._nextSeed(),
-      version: 1,
-      versionNonce: 1,
-      backgroundColor: "transparent",
     };
-    this.elements.push(el);
-    return el;
+    return this._push(el);
   }
 
   diamond(id, x, y, size = 12, fill = "#ffd43b", stroke = "#f59f00") {
     const el = {
+      ...ExcalidrawPresentation._DIAMOND_TEMPLATE,
       id,
-      type: "diamond",
       x,
       y,
       width: size,
       height: size,
       backgroundColor: fill,
       strokeColor: stroke,
-      strokeWidth: 2,
-      fillStyle: "solid",
-      roughness: 1,
-      isDeleted: false,
-      strokeStyle: "solid",
-      opacity: 100,
-      angle: 0,
       groupIds: [],
-      frameId: null,
-      roundness: null,
       boundElements: [],
-      locked: false,
       seed: this._nextSeed(),
-      version: 1,
-      versionNonce: 1,
     };
-    this.elements.push(el);
-    return el;
+    return this._push(el);
   }
 
   // ── Shadow ──────────────────────────────────────────────────
@@ -438,15 +516,15 @@ class ExcalidrawPresentation {
   shadow(id, x, y, w, h) {
     return this.rect(
       `${id}-shadow`,
-      x + 6,
-      y + 6,
+      x + SHADOW_OFFSET,
+      y + SHADOW_OFFSET,
       w,
       h,
-      "#adb5bd",
+      SHADOW_FILL,
       "transparent",
       2,
       3,
-      40
+      SHADOW_OPACITY
     );
   }
 
@@ -474,28 +552,32 @@ class ExcalidrawPresentation {
     iconText = null,
     badges = null
   ) {
-    const c = COLORS[color];
-    let bannerH = 90;
+    const { fill, stroke, accent, light } = COLORS[color];
     const x = this.CONTENT_X;
+    const bannerW = 750;
+
+    // Measure the wrapped title/subtitle first so the background is
+    // created at its final height — no placeholder rect to mutate later.
+    const bannerTitleMaxW = bannerW - 95 - 20;
+    title = this._wrapText(title, bannerTitleMaxW, 36, 5);
+    const titleH = this._textHeight(title, 36);
+    const subtitleH = subtitle ? this._textHeight(subtitle, 20) : 0;
+    const bannerH = Math.max(90, titleH + 10 + (subtitle ? subtitleH + 10 : 15));
 
     // Banner background
-    const bannerW = 750;
-    this.rect(`${id}-bg`, x, y, bannerW, bannerH, c.fill, c.stroke);
+    this.rect(`${id}-bg`, x, y, bannerW, bannerH, fill, stroke);
 
     // Icon circle with centered text
     const circleSize = 60;
     const circleX = x + 20;
     const circleY = y + 15;
-    this.circle(`${id}-icon`, circleX, circleY, circleSize, c.accent, c.stroke);
+    this.circle(`${id}-icon`, circleX, circleY, circleSize, accent, stroke);
     if (iconText) {
       const iconFont = 26;
       this.centerTextInCircle(`${id}-icon-text`, iconText, iconFont, circleX, circleY, circleSize);
     }
 
     // Title (Excalifont hand-drawn font, wrapped)
-    const bannerTitleMaxW = bannerW - 95 - 20;
-    title = this._wrapText(title, bannerTitleMaxW, 36, 5);
-    const titleH = this._textHeight(title, 36);
     this.text(`${id}-title`, x + 95, y + 15, title, 36, 5, "#ffffff");
 
     // Subtitle (dynamic Y based on title height)
@@ -508,33 +590,23 @@ class ExcalidrawPresentation {
         subtitle,
         20,
         6,
-        c.light || "#f3d9fa"
+        light || "#f3d9fa"
       );
     }
 
-    // Update banner height if title/subtitle overflow
-    const subtitleH = subtitle ? this._textHeight(subtitle, 20) : 0;
-    bannerH = Math.max(90, titleH + 10 + (subtitle ? subtitleH + 10 : 15));
-    const bannerBg = this.elements.find((el) => el.id === `${id}-bg`);
-    if (bannerBg) bannerBg.height = bannerH;
-
     // Badges on the right
     if (badges) {
       const badgeX = 810;
       const badgeW = 130;
-      for (let i = 0; i < badges.length; i++) {
-        const [label, badgeColor] = badges[i];
+      const badgeIdPrefix = `${id}-badge-`;
+      const badgeTextIdPrefix = `${id}-badge-text-`;
+      // Destructure [label, color] pairs in the loop head and step the
+      // y position directly instead of indexing and re-deriving it.
+      let by = y + 10;
+      let i = 0;
+      for (const [label, badgeColor] of badges) {
         const bc = COLORS[badgeColor];
-        const by = y + 10 + i * 40;
-        this.rect(
-          `${id}-badge-${i}`,
-          badgeX,
-          by,
-          badgeW,
-          35,
-          bc.fill,
-          bc.stroke
-        );
+        this.rect(badgeIdPrefix + i, badgeX, by, badgeW, 35, bc.fill, bc.stroke);
         const [lx, ly] = this.centerTextInRect(
           label,
           16,
@@ -543,7 +615,9 @@ class ExcalidrawPresentation {
           badgeW,
           35
         );
-        this.text(`${id}-badge-text-${i}`, lx, ly, label, 16, 6, "#ffffff");
+        this.text(badgeTextIdPrefix + i, lx, ly, label, 16, 6, "#ffffff");
+        i += 1;
+        by += 40;
       }
     }
 
@@ -551,18 +625,20 @@ class ExcalidrawPresentation {
   }
 
   sectionHeader(id, y, title, color = "blue") {
-    const c = COLORS[color];
+    const { accent, stroke } = COLORS[color];
+    // Wrap and measure before drawing so the bg rect never needs resizing.
+    const sectionMaxW = this.CONTENT_WIDTH - 80;
+    title = this._wrapText(title, sectionMaxW, 35, 7);
+    const sectionH = Math.max(70, this._textHeight(title, 35) + 28);
     this.rect(
       `${id}-bg`,
       this.CONTENT_X,
       y,
       this.CONTENT_WIDTH,
-      70,
-      c.accent,
-      c.stroke
+      sectionH,
+      accent,
+      stroke
     );
-    const sectionMaxW = this.CONTENT_WIDTH - 80;
-    title = this._wrapText(title, sectionMaxW, 35, 7);
     this.text(
       `${id}-text`,
       this.CONTENT_X + 40,
@@ -572,19 +648,15 @@ class ExcalidrawPresentation {
       7,
       "#ffffff"
     );
-    const sectionH = Math.max(70, this._textHeight(title, 35) + 28);
-    // Update bg rect height if it grew
-    const sectionBg = this.elements.find((el) => el.id === `${id}-bg`);
-    if (sectionBg) sectionBg.height = sectionH;
     return y + sectionH + 20;
   }
 
   blockNumber(id, y, number, label, duration = null, color = "blue") {
-    const c = COLORS[color];
+    const { fill, stroke } = COLORS[color];
     const x = this.CONTENT_X + 47;
 
     const circleSize = 50;
-    this.circle(`${id}-circle`, x, y, circleSize, c.fill, c.stroke);
+    this.circle(`${id}-circle`, x, y, circleSize, fill, stroke);
     const numStr = String(number);
     const numFont = 23;
     this.centerTextInCircle(`${id}-num`, numStr, numFont, x, y, circleSize);
@@ -608,17 +680,28 @@ class ExcalidrawPresentation {
     tag = null,
     withShadow = false
   ) {
-    const c = COLORS[color];
+    const { bg, stroke, fill, accent } = COLORS[color];
+
+    // Measure the wrapped title/body first so the card (and its shadow)
+    // are created at their final, auto-grown height in one pass.
+    const availableW = w - 40;
+    const wrappedTitle = this._wrapText(title, availableW, 21, 6);
+    const titleH = this._textMetrics(wrappedTitle, 21)[1];
+    const bodyY = y + 50 + titleH + 10;
+    const wrappedBody = this._wrapText(body, availableW, 16, 6);
+    const bodyTextH = this._textMetrics(wrappedBody, 16)[1];
+    const minH = bodyY - y + bodyTextH + 20;
+    if (h < minH) h = minH;
 
     if (withShadow) {
       this.shadow(id, x, y, w, h);
     }
 
     // Card body
-    this.rect(`${id}-body`, x, y, w, h, c.bg, c.stroke);
+    this.rect(`${id}-body`, x, y, w, h, bg, stroke);
 
     // Header strip
-    this.rect(`${id}-header`, x, y, w, 36, c.fill, c.stroke);
+    this.rect(`${id}-header`, x, y, w, 36, fill, stroke);
 
     // Tag badge (centered text)
     if (tag) {
@@ -627,7 +710,7 @@ class ExcalidrawPresentation {
       const tagTextW = this._textWidth(tag, tagFont);
       const tagW = Math.max(tagTextW + 24, 80);
       const tagX = x + w - tagW - 15;
-      this.rect(`${id}-tag-bg`, tagX, y + 5, tagW, 27, c.accent, c.stroke);
+      this.rect(`${id}-tag-bg`, tagX, y + 5, tagW, 27, accent, stroke);
       const [textX, textY] = this.centerTextInRect(
         tag,
         tagFont,
@@ -648,14 +731,10 @@ class ExcalidrawPresentation {
     }
 
     // Title (wrapped)
-    const availableW = w - 40;
-    const wrappedTitle = this._wrapText(title, availableW, 21, 6);
-    const titleEl = this.text(`${id}-title`, x + 20, y + 50, wrappedTitle, 21, 6, "#1e1e1e");
+    this.text(`${id}-title`, x + 20, y + 50, wrappedTitle, 21, 6, "#1e1e1e");
 
     // Body text (wrapped)
-    const bodyY = y + 50 + titleEl.height + 10;
-    const wrappedBody = this._wrapText(body, availableW, 16, 6);
-    const bodyEl = this.text(
+    this.text(
       `${id}-body-text`,
       x + 20,
       bodyY,
@@ -665,17 +744,6 @@ class ExcalidrawPresentation {
       "#495057"
     );
 
-    // Auto-grow card height if body text overflows
-    const minH = (bodyY - y) + bodyEl.height + 20;
-    if (h < minH) {
-      const cardBody = this.elements.find((el) => el.id === `${id}-body`);
-      if (cardBody) cardBody.height = minH;
-      // Also grow shadow if present
-      const shadowEl = this.elements.find((el) => el.id === `${id}-shadow`);
-      if (shadowEl) shadowEl.height = minH;
-      h = minH;
-    }
-
     return y + h + 20;
   }
 
@@ -687,6 +755,7 @@ class ExcalidrawPresentation {
     const startX = this.CONTENT_X + padding;
 
     let bottomY = y;
+    const cardIdPrefix = `${id}-card-`;
     for (let i = 0; i < cards.length; i++) {
       const row = Math.floor(i / maxPerRow);
       const col = i % maxPerRow;
@@ -694,7 +763,7 @@ class ExcalidrawPresentation {
       const x = startX + col * (cardW + gap);
       const rowY = row === 0 ? y : bottomY;
       const cardBottom = this.contentCard(
-        `${id}-card-${i}`,
+        cardIdPrefix + i,
         x,
         rowY,
         cardW,
@@ -710,7 +779,7 @@ class ExcalidrawPresentation {
         const rowStart = row * maxPerRow;
         let rowBottom = rowY;
         for (let j = rowStart; j <= i; j++) {
-          const el = this.elements.find((e) => e.id === `${id}-card-${j}-body`);
+          const el = this._byId.get(`${cardIdPrefix}${j}-body`);
           if (el) rowBottom = Math.max(rowBottom, el.y + el.height + 20);
         }
         bottomY = rowBottom;
@@ -812,9 +881,10 @@ class ExcalidrawPresentation {
       6,
       "#ffffff"
     );
+    const negItemIdPrefix = `${id}-neg-item-`;
     for (let i = 0; i < negWrapped.length; i++) {
       this.text(
-        `${id}-neg-item-${i}`,
+        negItemIdPrefix + i,
         this.CARD_LEFT_X + 20,
         negWrapped[i].y,
         negWrapped[i].text,
@@ -853,9 +923,10 @@ class ExcalidrawPresentation {
       6,
       "#ffffff"
     );
+    const posItemIdPrefix = `${id}-pos-item-`;
     for (let i = 0; i < posWrapped.length; i++) {
       this.text(
-        `${id}-pos-item-${i}`,
+        posItemIdPrefix + i,
         this.CARD_RIGHT_X + 20,
         posWrapped[i].y,
         posWrapped[i].text,
@@ -869,7 +940,7 @@ class ExcalidrawPresentation {
   }
 
   tipBox(id, y, text, emoji = "\uD83D\uDCA1", color = "yellow") {
-    const c = COLORS[color];
+    const { bg, stroke } = COLORS[color];
     const tipTextMaxW = this.CONTENT_WIDTH - 55 - 15;
     text = this._wrapText(text, tipTextMaxW, 17, 6);
     const textH = this._textHeight(text, 17);
@@ -881,8 +952,8 @@ class ExcalidrawPresentation {
       y,
       this.CONTENT_WIDTH,
       boxH,
-      c.bg,
-      c.stroke
+      bg,
+      stroke
     );
     const emojiSize = 28;
     this.text(
@@ -916,12 +987,14 @@ class ExcalidrawPresentation {
     fontSize = 16,
     bulletColor = "blue"
   ) {
-    const c = COLORS[bulletColor];
+    const { fill, stroke } = COLORS[bulletColor];
     let currentY = y;
+    const bulletIdPrefix = `${id}-bullet-`;
+    const itemIdPrefix = `${id}-item-`;
     for (let i = 0; i < items.length; i++) {
-      this.circle(`${id}-bullet-${i}`, x, currentY + 4, 10, c.fill, c.stroke);
+      this.circle(bulletIdPrefix + i, x, currentY + 4, 10, fill, stroke);
       this.text(
-        `${id}-item-${i}`,
+        itemIdPrefix + i,
         x + 20,
         currentY,
         items[i],
@@ -935,10 +1008,18 @@ class ExcalidrawPresentation {
   }
 
   progressDots(id, x, y, total, active = 0, color = "yellow") {
-    const c = COLORS[color];
-    for (let i = 0; i < total; i++) {
-      const fill = i < active ? c.fill : c.bg;
-      this.diamond(`${id}-dot-${i}`, x + i * 18, y, 12, fill, c.stroke);
+    const { fill, bg, stroke } = COLORS[color];
+    const dotIdPrefix = `${id}-dot-`;
+    // Two runs (active, then inactive) instead of branching per dot, with
+    // the x position advanced incrementally rather than recomputed.
+    const activeEnd = Math.min(active, total);
+    let dotX = x;
+    let i = 0;
+    for (; i < activeEnd; i++, dotX += 18) {
+      this.diamond(dotIdPrefix + i, dotX, y, 12, fill, stroke);
+    }
+    for (; i < total; i++, dotX += 18) {
+      this.diamond(dotIdPrefix + i, dotX, y, 12, bg, stroke);
     }
     return y + 20;
   }
@@ -966,14 +1047,37 @@ class ExcalidrawPresentation {
     };
   }
 
-  save(path) {
-    fs.writeFileSync(path, JSON.stringify(this.toJSON(), null, 2), "utf-8");
+  save(path, { pretty = false } = {}) {
+    // Compact JSON by default — indentation roughly doubles file size and
+    // stringify time for large decks, and Excalidraw doesn't care. Pass
+    // { pretty: true } when a diffable file is wanted.
+    const json = pretty
+      ? JSON.stringify(this.toJSON(), null, 2)
+      : JSON.stringify(this.toJSON());
+    fs.writeFileSync(path, json, "utf-8");
     console.log(`Saved to ${path}`);
     console.log(
       `   ${this.elements.length} elements, ${this.slides.length} slides`
     );
   }
 
+  // Serialize and write several decks at once. Stringify stays on this
+  // thread (shipping decks to worker threads would clone more data than
+  // it saves), but the disk writes overlap via the promise-based fs API.
+  static async saveMany(presentations, paths) {
+    if (presentations.length !== paths.length) {
+      throw new Error(
+        `saveMany: ${presentations.length} presentations but ${paths.length} paths`
+      );
+    }
+    await Promise.all(
+      presentations.map((p, i) =>
+        fs.promises.writeFile(paths[i], JSON.stringify(p.toJSON()), "utf-8")
+      )
+    );
+    console.log(`Saved ${paths.length} presentations`);
+  }
+
   async push(url = "http://localhost:41520", clear = true) {
     const base = url.replace(/\/+$/, "");
 